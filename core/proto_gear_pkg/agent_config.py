@@ -25,9 +25,13 @@ from .capability_metadata import (
     CompositionEngine,
     CapabilityValidator,
     CapabilityMetadata,
-    ValidationError as CapabilityValidationError
+    ValidationError as CapabilityValidationError,
+    _YamlSafeLoader
 )
 
+# Use the libyaml C dumper when PyYAML was built with it
+_YamlDumper = getattr(yaml, 'CDumper', yaml.Dumper)
+
 
 class AgentValidationError(Exception):
     """Raised when agent configuration validation fails"""
@@ -114,6 +118,8 @@ class AgentConfigParser:
 
     VERSION_PATTERN = re.compile(r'^\d+\.\d+\.\d+$')
     DATE_PATTERN = re.compile(r'^\d{4}-\d{2}-\d{2}$')
+    VALID_STATUSES = ["active", "inactive", "experimental"]
+    REQUIRED_FIELDS = ["name", "version", "description", "created"]
 
     @staticmethod
     def parse_agent_file(file_path: Path) -> AgentConfiguration:
@@ -135,7 +141,7 @@ class AgentConfigParser:
             raise FileNotFoundError(f"Agent configuration file not found: {file_path}")
 
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlSafeLoader)
 
         if not isinstance(data, dict):
             raise AgentValidationError(
@@ -212,11 +218,10 @@ class AgentConfigParser:
         status = data.get("status", "active")
 
         # Validate status
-        valid_statuses = ["active", "inactive", "experimental"]
-        if status not in valid_statuses:
+        if status not in AgentConfigParser.VALID_STATUSES:
             raise AgentValidationError(
                 f"Invalid status '{status}' in {source}. "
-                f"Must be one of: {valid_statuses}"
+                f"Must be one of: {AgentConfigParser.VALID_STATUSES}"
             )
 
         return AgentConfiguration(
@@ -237,10 +242,9 @@ class AgentConfigParser:
     @staticmethod
     def _validate_required_fields(data: Dict[str, Any], source: str = ""):
         """Validate that all required fields are present"""
-        required_fields = ["name", "version", "description", "created"]
         missing_fields = []
 
-        for field in required_fields:
+        for field in AgentConfigParser.REQUIRED_FIELDS:
             if field not in data or not data[field]:
                 missing_fields.append(field)
 
@@ -477,8 +481,8 @@ class AgentManager:
 
         # Save to file
         agent_file = self.agents_dir / f"{agent_name}.yaml"
-        with open(agent_file, 'w', encoding='utf-8') as f:
-            yaml.dump(agent.to_dict(), f, default_flow_style=False, sort_keys=False)
+        yaml_str = yaml.dump(agent.to_dict(), Dumper=_YamlDumper, default_flow_style=False, sort_keys=False)
+        agent_file.write_text(yaml_str, encoding='utf-8')
 
     def delete_agent(self, agent_name: str):
         """
@@ -12,13 +12,18 @@ Supports:
 - Conflict detection
 """
 
+import os
 import re
+from collections import deque
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Set, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
 import yaml
 
+# Use the libyaml C loader when PyYAML was built with it
+_YamlSafeLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 class CapabilityType(Enum):
     """Types of capabilities"""
@@ -213,7 +218,7 @@ class CapabilityMetadataParser:
             raise FileNotFoundError(f"Metadata file not found: {file_path}")
 
         with open(file_path, 'r', encoding='utf-8') as f:
-            data = yaml.safe_load(f)
+            data = yaml.load(f, Loader=_YamlSafeLoader)
 
         if not isinstance(data, dict):
             raise ValidationError(f"Metadata file must contain YAML dictionary: {file_path}")
@@ -497,10 +502,10 @@ class CompositionEngine:
             ValidationError: If dependencies cannot be resolved
         """
         resolved = set(capabilities)
-        to_process = list(capabilities)
+        to_process = deque(capabilities)
 
         while to_process:
-            current = to_process.pop(0)
+            current = to_process.popleft()
 
             if current not in all_capabilities:
                 raise ValidationError(f"Capability not found: {current}")
@@ -581,6 +586,67 @@ class CompositionEngine:
 
         return sorted(recommended)
 
+    @staticmethod
+    def find_by_trigger(
+        query: str,
+        all_capabilities: Dict[str, CapabilityMetadata]
+    ) -> List[str]:
+        """
+        Find capabilities whose trigger keywords appear in a query.
+
+        Equivalent to calling relevance.matches_trigger(query) on every
+        capability, but the query is lowercased once and each distinct
+        trigger is checked once, however many capabilities share it.
+
+        Args:
+            query: Free-text query
+            all_capabilities: Dict of all available capabilities
+
+        Returns:
+            List of matching capability IDs, in all_capabilities order
+        """
+        query_lower = query.lower()
+        trigger_hits: Dict[str, bool] = {}
+        matches = []
+
+        for cap_id, metadata in all_capabilities.items():
+            if not metadata.relevance:
+                continue
+
+            for trigger in metadata.relevance.triggers:
+                trigger_lower = trigger.lower()
+                hit = trigger_hits.get(trigger_lower)
+                if hit is None:
+                    hit = trigger_hits[trigger_lower] = trigger_lower in query_lower
+                if hit:
+                    matches.append(cap_id)
+                    break
+
+        return matches
+
+
+def _iter_metadata_files(directory: Path):
+    """
+    Yield metadata.yaml files below a directory.
+
+    Uses os.scandir so file types come from the directory listing rather than
+    a stat() per entry. Hidden entries are skipped and directory symlinks are
+    not followed. Unreadable or missing directories yield nothing, as with rglob.
+    """
+    try:
+        entries = os.scandir(directory)
+    except OSError:
+        return
+
+    with entries:
+        for entry in entries:
+            if entry.name.startswith('.'):
+                continue
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_metadata_files(Path(entry.path))
+            elif entry.name == "metadata.yaml":
+                yield Path(entry.path)
+
 
 def load_all_capabilities(capabilities_dir: Path) -> Dict[str, CapabilityMetadata]:
     """
@@ -595,7 +661,7 @@ def load_all_capabilities(capabilities_dir: Path) -> Dict[str, CapabilityMetadat
     capabilities = {}
 
     # Scan for metadata.yaml files
-    for metadata_file in capabilities_dir.rglob("metadata.yaml"):
+    for metadata_file in _iter_metadata_files(capabilities_dir):
         try:
             metadata = CapabilityMetadataParser.parse_metadata_file(metadata_file)
 
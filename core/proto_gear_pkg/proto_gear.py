@@ -6,6 +6,7 @@ Main entry point for integrating AI-powered development workflows
 
 import sys
 import os
+import re
 import time
 import random
 from pathlib import Path
@@ -863,6 +864,9 @@ def generate_project_template(template_name, project_dir, context, dry_run=False
         return (None, 'error')
 
 
+# Placeholders substituted in capability templates, matched in a single pass
+_CAPABILITY_PLACEHOLDER_PATTERN = re.compile(r'\{\{(VERSION|PROJECT_NAME)\}\}')
+
 
 def copy_capability_templates(target_dir: Path, project_name: str, version: str = None, dry_run: bool = False, capabilities_config: dict = None) -> dict:
     """
@@ -930,7 +934,13 @@ def copy_capability_templates(target_dir: Path, project_name: str, version: str
         print(f"\n{Colors.YELLOW}Dry run - capability files that would be created:{Colors.ENDC}")
         print(f"  Directory: .proto-gear/")
 
+    placeholders = {'VERSION': version, 'PROJECT_NAME': project_name}
+    prepared_dirs = set()
+
     try:
+        if not dry_run and not isinstance(project_name, str):
+            raise TypeError(f"project_name must be a string, not {type(project_name).__name__}")
+
         # Walk through source directory
         for source_path in source_dir.rglob('*'):
             # Skip directories and symlinks
@@ -983,15 +993,18 @@ def copy_capability_templates(target_dir: Path, project_name: str, version: str
                 print(f"    - {dest_path.relative_to(target_dir)}")
                 result['files_created'].append(str(dest_path.relative_to(target_dir)))
             else:
-                # Create parent directories
-                dest_path.parent.mkdir(parents=True, exist_ok=True)
+                # Create parent directories once per directory
+                if dest_path.parent not in prepared_dirs:
+                    dest_path.parent.mkdir(parents=True, exist_ok=True)
 
-                # Set directory permissions (755)
-                try:
-                    dest_path.parent.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
-                except (OSError, NotImplementedError):
-                    # Some platforms don't support chmod
-                    pass
+                    # Set directory permissions (755)
+                    try:
+                        dest_path.parent.chmod(stat.S_IRWXU | stat.S_IRGRP | stat.S_IXGRP | stat.S_IROTH | stat.S_IXOTH)
+                    except (OSError, NotImplementedError):
+                        # Some platforms don't support chmod
+                        pass
+
+                    prepared_dirs.add(dest_path.parent)
 
                 # Read source file with UTF-8 encoding
                 try:
@@ -1001,8 +1014,7 @@ def copy_capability_templates(target_dir: Path, project_name: str, version: str
                     continue
 
                 # Replace placeholders
-                content = content.replace('{{VERSION}}', version)
-                content = content.replace('{{PROJECT_NAME}}', project_name)
+                content = _CAPABILITY_PLACEHOLDER_PATTERN.sub(lambda m: placeholders[m.group(1)], content)
 
                 # Write to destination with UTF-8 encoding
                 dest_path.write_text(content, encoding='utf-8')
@@ -1594,9 +1606,8 @@ def run_simple_protogear_init(dry_run=False, force=False, with_branching=False,
     return result
 
 
-def main():
-    """Main entry point for Proto Gear AI Agent Framework"""
-    # Add argument parsing
+def _build_parser():
+    """Build the argparse parser for the pg command line"""
     parser = argparse.ArgumentParser(
         description="Proto Gear - AI Agent Framework for Development Workflows",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -1959,7 +1970,12 @@ For more information, visit: https://github.com/proto-gear/proto-gear
         help='Show diff and exit without applying changes'
     )
 
-    args = parser.parse_args()
+    return parser
+
+
+def main():
+    """Main entry point for Proto Gear AI Agent Framework"""
+    args = _build_parser().parse_args()
 
     try:
         # Handle 'init' command
@@ -5,6 +5,7 @@ Interactive demonstration of the v0.8.0 Composition Engine
 Run this script to see the composition engine in action.
 """
 
+from collections import Counter
 from pathlib import Path
 from core.proto_gear_pkg.capability_metadata import (
     load_all_capabilities,
@@ -96,22 +97,20 @@ def main():
     print("--- Example 7: Search by Trigger Keywords ---")
     query = "bug"
     print(f"Searching for capabilities matching '{query}'...")
-    matches = []
-    for cap_id, metadata in all_caps.items():
-        if metadata.relevance and metadata.relevance.matches_trigger(query):
-            matches.append((cap_id, metadata.name))
+    matches = CompositionEngine.find_by_trigger(query, all_caps)
 
     print(f"Found {len(matches)} matches:")
-    for cap_id, name in matches[:5]:
-        print(f"  -> {cap_id}: {name}")
+    for cap_id in matches[:5]:
+        print(f"  -> {cap_id}: {all_caps[cap_id].name}")
     print()
 
     # Summary
     print("=== Summary ===")
+    categories = Counter(cap_id.split('/', 1)[0] for cap_id in all_caps)
     print(f"Total capabilities: {len(all_caps)}")
-    print(f"  - Skills: {len([c for c in all_caps if c.startswith('skills/')])}")
-    print(f"  - Workflows: {len([c for c in all_caps if c.startswith('workflows/')])}")
-    print(f"  - Commands: {len([c for c in all_caps if c.startswith('commands/')])}")
+    print(f"  - Skills: {categories['skills']}")
+    print(f"  - Workflows: {categories['workflows']}")
+    print(f"  - Commands: {categories['commands']}")
     print()
     print("PASS: Composition engine is ready for v0.8.0!")
 
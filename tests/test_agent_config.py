@@ -9,6 +9,7 @@ Tests cover:
 - Error handling
 """
 
+import copy
 import pytest
 import tempfile
 from pathlib import Path
@@ -29,41 +30,49 @@ from proto_gear_pkg.agent_config import (
 # Test Data Fixtures
 # ============================================================================
 
+VALID_AGENT_DICT = {
+    "name": "Testing Agent",
+    "version": "1.0.0",
+    "description": "Agent for TDD and quality assurance",
+    "created": "2025-12-09",
+    "author": "Test Author",
+    "capabilities": {
+        "skills": ["testing", "debugging"],
+        "workflows": ["feature-development"],
+        "commands": ["analyze-coverage"]
+    },
+    "context_priority": [
+        "Read TESTING.md first",
+        "Check test coverage"
+    ],
+    "agent_instructions": [
+        "Follow TDD",
+        "Aim for 80%+ coverage"
+    ],
+    "required_files": ["TESTING.md"],
+    "optional_files": ["PROJECT_STATUS.md"],
+    "tags": ["testing", "tdd"],
+    "status": "active"
+}
+
+
 @pytest.fixture
 def valid_agent_dict():
     """Valid agent configuration dictionary"""
-    return {
-        "name": "Testing Agent",
-        "version": "1.0.0",
-        "description": "Agent for TDD and quality assurance",
-        "created": "2025-12-09",
-        "author": "Test Author",
-        "capabilities": {
-            "skills": ["testing", "debugging"],
-            "workflows": ["feature-development"],
-            "commands": ["analyze-coverage"]
-        },
-        "context_priority": [
-            "Read TESTING.md first",
-            "Check test coverage"
-        ],
-        "agent_instructions": [
-            "Follow TDD",
-            "Aim for 80%+ coverage"
-        ],
-        "required_files": ["TESTING.md"],
-        "optional_files": ["PROJECT_STATUS.md"],
-        "tags": ["testing", "tdd"],
-        "status": "active"
-    }
+    return copy.deepcopy(VALID_AGENT_DICT)
+
+
+@pytest.fixture(scope="module")
+def valid_agent_yaml():
+    """VALID_AGENT_DICT serialized once for tests that only write it to disk"""
+    return yaml.dump(VALID_AGENT_DICT)
 
 
 @pytest.fixture
-def temp_agent_file(tmp_path, valid_agent_dict):
+def temp_agent_file(tmp_path, valid_agent_yaml):
     """Create temporary agent YAML file"""
     agent_file = tmp_path / "testing-agent.yaml"
-    with open(agent_file, 'w') as f:
-        yaml.dump(valid_agent_dict, f)
+    agent_file.write_text(valid_agent_yaml)
     return agent_file
 
 
@@ -75,10 +84,10 @@ def temp_agents_dir(tmp_path):
     return agents_dir
 
 
-@pytest.fixture
-def temp_capabilities_dir(tmp_path):
-    """Create temporary capabilities directory with mock metadata"""
-    caps_dir = tmp_path / "capabilities"
+@pytest.fixture(scope="module")
+def temp_capabilities_dir(tmp_path_factory):
+    """Create temporary capabilities directory with mock metadata (read-only, shared)"""
+    caps_dir = tmp_path_factory.mktemp("agent_config", numbered=False) / "capabilities"
 
     # Create skills
     skills_dir = caps_dir / "skills" / "testing"
@@ -254,13 +263,12 @@ class TestAgentManager:
         assert len(agents) == 0
 
     def test_list_agents_with_agents(
-        self, temp_agents_dir, temp_capabilities_dir, valid_agent_dict
+        self, temp_agents_dir, temp_capabilities_dir, valid_agent_dict, valid_agent_yaml
     ):
         """Test listing agents in directory with agents"""
         # Create agent files
         agent1_file = temp_agents_dir / "agent1.yaml"
-        with open(agent1_file, 'w') as f:
-            yaml.dump(valid_agent_dict, f)
+        agent1_file.write_text(valid_agent_yaml)
 
         agent2_dict = valid_agent_dict.copy()
         agent2_dict["name"] = "Another Agent"
@@ -275,11 +283,10 @@ class TestAgentManager:
         assert agents[0].name == "Another Agent"  # Sorted alphabetically
         assert agents[1].name == "Testing Agent"
 
-    def test_load_agent(self, temp_agents_dir, temp_capabilities_dir, valid_agent_dict):
+    def test_load_agent(self, temp_agents_dir, temp_capabilities_dir, valid_agent_yaml):
         """Test loading specific agent"""
         agent_file = temp_agents_dir / "testing-agent.yaml"
-        with open(agent_file, 'w') as f:
-            yaml.dump(valid_agent_dict, f)
+        agent_file.write_text(valid_agent_yaml)
 
         manager = AgentManager(temp_agents_dir, temp_capabilities_dir)
         agent = manager.load_agent("testing-agent")
@@ -313,11 +320,10 @@ class TestAgentManager:
             data = yaml.safe_load(f)
         assert data["name"] == "Test Agent"
 
-    def test_delete_agent(self, temp_agents_dir, temp_capabilities_dir, valid_agent_dict):
+    def test_delete_agent(self, temp_agents_dir, temp_capabilities_dir, valid_agent_yaml):
         """Test deleting agent configuration"""
         agent_file = temp_agents_dir / "test-agent.yaml"
-        with open(agent_file, 'w') as f:
-            yaml.dump(valid_agent_dict, f)
+        agent_file.write_text(valid_agent_yaml)
 
         manager = AgentManager(temp_agents_dir, temp_capabilities_dir)
         manager.delete_agent("test-agent")
@@ -21,10 +21,10 @@ from proto_gear_pkg.agent_wizard import (
 )
 
 
-@pytest.fixture
-def temp_capabilities_dir(tmp_path):
-    """Create temporary capabilities directory"""
-    caps_dir = tmp_path / "capabilities"
+@pytest.fixture(scope="module")
+def temp_capabilities_dir(tmp_path_factory):
+    """Create temporary capabilities directory (read-only, shared)"""
+    caps_dir = tmp_path_factory.mktemp("agent_wizard", numbered=False) / "capabilities"
 
     # Create a test skill
     skills_dir = caps_dir / "skills" / "test-skill"
@@ -53,13 +53,17 @@ def temp_capabilities_dir(tmp_path):
     return caps_dir
 
 
+@pytest.fixture(scope="module")
+def all_caps(temp_capabilities_dir):
+    """Capabilities parsed once from temp_capabilities_dir"""
+    return load_all_capabilities(temp_capabilities_dir)
+
+
 class TestValidateCapabilitySelections:
     """Tests for validate_capability_selections"""
 
-    def test_valid_capabilities(self, temp_capabilities_dir):
+    def test_valid_capabilities(self, all_caps):
         """Test validation with valid capabilities"""
-        all_caps = load_all_capabilities(temp_capabilities_dir)
-
         capabilities = AgentCapabilities(
             skills=["test-skill"]
         )
@@ -67,10 +71,8 @@ class TestValidateCapabilitySelections:
         errors = validate_capability_selections(capabilities, all_caps)
         assert errors == []
 
-    def test_missing_capability(self, temp_capabilities_dir):
+    def test_missing_capability(self, all_caps):
         """Test validation with missing capability"""
-        all_caps = load_all_capabilities(temp_capabilities_dir)
-
         capabilities = AgentCapabilities(
             skills=["nonexistent-skill"]
         )
@@ -79,10 +81,8 @@ class TestValidateCapabilitySelections:
         assert len(errors) > 0
         assert "not found" in errors[0].lower()
 
-    def test_empty_capabilities(self, temp_capabilities_dir):
+    def test_empty_capabilities(self, all_caps):
         """Test validation with no capabilities"""
-        all_caps = load_all_capabilities(temp_capabilities_dir)
-
         capabilities = AgentCapabilities()
 
         # Empty capabilities should be valid (checked elsewhere)
@@ -10,12 +10,13 @@ Tests cover:
 - Composition engine functionality
 """
 
+import copy
 import pytest
 import tempfile
 from pathlib import Path
 import yaml
 
-from core.proto_gear_pkg.capability_metadata import (
+from proto_gear_pkg.capability_metadata import (
     CapabilityMetadata,
     CapabilityMetadataParser,
     CapabilityValidator,
@@ -35,101 +36,127 @@ from core.proto_gear_pkg.capability_metadata import (
 # Test Data Fixtures
 # ============================================================================
 
+VALID_SKILL_METADATA = {
+    "name": "Test-Driven Development",
+    "type": "skill",
+    "version": "1.0.0",
+    "description": "TDD methodology",
+    "category": "testing",
+    "tags": ["testing", "tdd"],
+    "status": "stable",
+    "author": "Proto Gear Team",
+    "last_updated": "2025-12-09",
+    "dependencies": {
+        "required": [],
+        "optional": ["workflows/feature-development"],
+        "suggested": ["skills/debugging"]
+    },
+    "conflicts": [],
+    "composable_with": ["skills/debugging"],
+    "agent_roles": ["Testing Agent"],
+    "relevance": {
+        "triggers": ["write tests", "testing"],
+        "contexts": ["Before implementing features"]
+    },
+    "usage_notes": "Works best with testing workflow",
+    "required_files": ["TESTING.md"],
+    "optional_files": []
+}
+
+
 @pytest.fixture
 def valid_skill_metadata():
     """Valid skill metadata dictionary"""
-    return {
-        "name": "Test-Driven Development",
-        "type": "skill",
-        "version": "1.0.0",
-        "description": "TDD methodology",
-        "category": "testing",
-        "tags": ["testing", "tdd"],
-        "status": "stable",
-        "author": "Proto Gear Team",
-        "last_updated": "2025-12-09",
-        "dependencies": {
-            "required": [],
-            "optional": ["workflows/feature-development"],
-            "suggested": ["skills/debugging"]
-        },
-        "conflicts": [],
-        "composable_with": ["skills/debugging"],
-        "agent_roles": ["Testing Agent"],
-        "relevance": {
-            "triggers": ["write tests", "testing"],
-            "contexts": ["Before implementing features"]
-        },
-        "usage_notes": "Works best with testing workflow",
-        "required_files": ["TESTING.md"],
-        "optional_files": []
+    return copy.deepcopy(VALID_SKILL_METADATA)
+
+
+VALID_WORKFLOW_METADATA = {
+    "name": "Bug Fix Workflow",
+    "type": "workflow",
+    "version": "1.0.0",
+    "description": "Systematic bug fixing",
+    "category": "maintenance",
+    "tags": ["bug", "fix"],
+    "status": "stable",
+    "author": "Proto Gear Team",
+    "last_updated": "2025-12-09",
+    "dependencies": {
+        "required": ["skills/debugging", "skills/testing"],
+        "optional": [],
+        "suggested": []
+    },
+    "conflicts": [],
+    "composable_with": ["skills/debugging"],
+    "agent_roles": ["Bug Fix Agent"],
+    "workflow": {
+        "steps": 9,
+        "estimated_duration": "1-3 hours",
+        "outputs": ["type: code", "type: tests"]
     }
+}
 
 
 @pytest.fixture
 def valid_workflow_metadata():
     """Valid workflow metadata dictionary"""
-    return {
-        "name": "Bug Fix Workflow",
-        "type": "workflow",
-        "version": "1.0.0",
-        "description": "Systematic bug fixing",
-        "category": "maintenance",
-        "tags": ["bug", "fix"],
-        "status": "stable",
-        "author": "Proto Gear Team",
-        "last_updated": "2025-12-09",
-        "dependencies": {
-            "required": ["skills/debugging", "skills/testing"],
-            "optional": [],
-            "suggested": []
-        },
-        "conflicts": [],
-        "composable_with": ["skills/debugging"],
-        "agent_roles": ["Bug Fix Agent"],
-        "workflow": {
-            "steps": 9,
-            "estimated_duration": "1-3 hours",
-            "outputs": ["type: code", "type: tests"]
-        }
+    return copy.deepcopy(VALID_WORKFLOW_METADATA)
+
+
+VALID_COMMAND_METADATA = {
+    "name": "Create Ticket",
+    "type": "command",
+    "version": "1.0.0",
+    "description": "Create ticket in PROJECT_STATUS.md",
+    "category": "project-management",
+    "tags": ["ticket", "planning"],
+    "status": "stable",
+    "author": "Proto Gear Team",
+    "last_updated": "2025-12-09",
+    "dependencies": {
+        "required": [],
+        "optional": [],
+        "suggested": []
+    },
+    "conflicts": [],
+    "composable_with": ["workflows/feature-development"],
+    "agent_roles": ["All Agents"],
+    "command": {
+        "idempotent": False,
+        "side_effects": ["PROJECT_STATUS.md"],
+        "prerequisites": ["PROJECT_STATUS.md must exist"]
     }
+}
 
 
 @pytest.fixture
 def valid_command_metadata():
     """Valid command metadata dictionary"""
-    return {
-        "name": "Create Ticket",
-        "type": "command",
-        "version": "1.0.0",
-        "description": "Create ticket in PROJECT_STATUS.md",
-        "category": "project-management",
-        "tags": ["ticket", "planning"],
-        "status": "stable",
-        "author": "Proto Gear Team",
-        "last_updated": "2025-12-09",
-        "dependencies": {
-            "required": [],
-            "optional": [],
-            "suggested": []
-        },
-        "conflicts": [],
-        "composable_with": ["workflows/feature-development"],
-        "agent_roles": ["All Agents"],
-        "command": {
-            "idempotent": False,
-            "side_effects": ["PROJECT_STATUS.md"],
-            "prerequisites": ["PROJECT_STATUS.md must exist"]
-        }
-    }
+    return copy.deepcopy(VALID_COMMAND_METADATA)
+
+
+@pytest.fixture(scope="module")
+def parsed_skill_metadata():
+    """VALID_SKILL_METADATA parsed once, shared by tests that only read it"""
+    return CapabilityMetadataParser._parse_metadata_dict(copy.deepcopy(VALID_SKILL_METADATA))
+
+
+@pytest.fixture(scope="module")
+def valid_skill_yaml():
+    """VALID_SKILL_METADATA serialized once for tests that only write it to disk"""
+    return yaml.dump(VALID_SKILL_METADATA)
+
+
+@pytest.fixture(scope="module")
+def valid_workflow_yaml():
+    """VALID_WORKFLOW_METADATA serialized once for tests that only write it to disk"""
+    return yaml.dump(VALID_WORKFLOW_METADATA)
 
 
 @pytest.fixture
-def temp_metadata_file(tmp_path, valid_skill_metadata):
+def temp_metadata_file(tmp_path, valid_skill_yaml):
     """Create temporary metadata.yaml file"""
     metadata_file = tmp_path / "metadata.yaml"
-    with open(metadata_file, 'w') as f:
-        yaml.dump(valid_skill_metadata, f)
+    metadata_file.write_text(valid_skill_yaml)
     return metadata_file
 
 
@@ -140,9 +167,9 @@ def temp_metadata_file(tmp_path, valid_skill_metadata):
 class TestCapabilityMetadataParser:
     """Tests for CapabilityMetadataParser"""
 
-    def test_parse_valid_skill_metadata(self, valid_skill_metadata):
+    def test_parse_valid_skill_metadata(self, parsed_skill_metadata):
         """Test parsing valid skill metadata"""
-        metadata = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        metadata = parsed_skill_metadata
 
         assert metadata.name == "Test-Driven Development"
         assert metadata.type == CapabilityType.SKILL
@@ -222,17 +249,17 @@ class TestCapabilityMetadataParser:
         with pytest.raises(yaml.YAMLError):
             CapabilityMetadataParser.parse_metadata_file(bad_file)
 
-    def test_parse_dependencies(self, valid_skill_metadata):
+    def test_parse_dependencies(self, parsed_skill_metadata):
         """Test parsing structured dependencies"""
-        metadata = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        metadata = parsed_skill_metadata
 
         assert metadata.dependencies.required == []
         assert "workflows/feature-development" in metadata.dependencies.optional
         assert "skills/debugging" in metadata.dependencies.suggested
 
-    def test_parse_relevance(self, valid_skill_metadata):
+    def test_parse_relevance(self, parsed_skill_metadata):
         """Test parsing relevance metadata"""
-        metadata = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        metadata = parsed_skill_metadata
 
         assert metadata.relevance is not None
         assert "write tests" in metadata.relevance.triggers
@@ -258,9 +285,9 @@ class TestCapabilityMetadataParser:
 class TestCapabilityValidator:
     """Tests for CapabilityValidator"""
 
-    def test_validate_valid_metadata(self, valid_skill_metadata):
+    def test_validate_valid_metadata(self, parsed_skill_metadata):
         """Test validation of valid metadata returns no warnings"""
-        metadata = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        metadata = parsed_skill_metadata
         warnings = CapabilityValidator.validate_metadata(metadata)
 
         assert len(warnings) == 0
@@ -560,6 +587,29 @@ class TestCompositionEngine:
         assert "skills/c" in recommended
         assert "skills/a" not in recommended  # Don't recommend what's already included
 
+    def test_find_by_trigger(self, valid_skill_metadata):
+        """Test finding capabilities by trigger keywords in a query"""
+        meta_a = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        meta_a.relevance = CapabilityRelevance(triggers=["write tests", "TDD"])
+
+        meta_b = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        meta_b.relevance = CapabilityRelevance(triggers=["tdd", "bug"])
+
+        meta_c = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
+        meta_c.relevance = None
+
+        all_capabilities = {
+            "skills/a": meta_a,
+            "skills/b": meta_b,
+            "skills/c": meta_c
+        }
+
+        assert CompositionEngine.find_by_trigger("Use tdd here", all_capabilities) == [
+            "skills/a", "skills/b"
+        ]
+        assert CompositionEngine.find_by_trigger("Fix a BUG", all_capabilities) == ["skills/b"]
+        assert CompositionEngine.find_by_trigger("unrelated query", all_capabilities) == []
+
 
 # ============================================================================
 # Data Class Tests
@@ -594,10 +644,9 @@ class TestDataClasses:
         assert relevance.matches_trigger("TDD methodology")
         assert not relevance.matches_trigger("unrelated query")
 
-    def test_capability_metadata_to_dict(self, valid_skill_metadata):
+    def test_capability_metadata_to_dict(self, parsed_skill_metadata):
         """Test CapabilityMetadata.to_dict() serialization"""
-        metadata = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
-        metadata_dict = metadata.to_dict()
+        metadata_dict = parsed_skill_metadata.to_dict()
 
         assert metadata_dict["name"] == "Test-Driven Development"
         assert metadata_dict["type"] == "skill"
@@ -612,7 +661,7 @@ class TestDataClasses:
 class TestIntegration:
     """Integration tests for complete workflows"""
 
-    def test_load_all_capabilities_from_directory(self, tmp_path, valid_skill_metadata, valid_workflow_metadata):
+    def test_load_all_capabilities_from_directory(self, tmp_path, valid_skill_yaml, valid_workflow_yaml):
         """Test loading all capabilities from a directory"""
         # Create directory structure
         skills_dir = tmp_path / "skills" / "testing"
@@ -622,11 +671,8 @@ class TestIntegration:
         workflows_dir.mkdir(parents=True)
 
         # Write metadata files
-        with open(skills_dir / "metadata.yaml", 'w') as f:
-            yaml.dump(valid_skill_metadata, f)
-
-        with open(workflows_dir / "metadata.yaml", 'w') as f:
-            yaml.dump(valid_workflow_metadata, f)
+        (skills_dir / "metadata.yaml").write_text(valid_skill_yaml)
+        (workflows_dir / "metadata.yaml").write_text(valid_workflow_yaml)
 
         # Load all capabilities
         capabilities = load_all_capabilities(tmp_path)
@@ -635,7 +681,43 @@ class TestIntegration:
         assert "skills/testing" in capabilities
         assert "workflows/bug-fix" in capabilities
 
-    def test_full_composition_workflow(self, tmp_path, valid_skill_metadata, valid_workflow_metadata):
+    def test_load_all_capabilities_skips_symlinked_directories(self, tmp_path, valid_skill_yaml):
+        """Test a symlinked subdirectory is not followed"""
+        outside_dir = tmp_path / "outside"
+        outside_dir.mkdir()
+        (outside_dir / "metadata.yaml").write_text(valid_skill_yaml)
+
+        capabilities_dir = tmp_path / "capabilities"
+        skill_dir = capabilities_dir / "skills" / "x"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "metadata.yaml").write_text(valid_skill_yaml)
+
+        try:
+            (capabilities_dir / "skills" / "linked").symlink_to(outside_dir, target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("Symlinks not supported on this platform")
+
+        capabilities = load_all_capabilities(capabilities_dir)
+
+        assert "skills/linked" not in capabilities
+        assert list(capabilities) == ["skills/x"]
+
+    def test_load_all_capabilities_skips_hidden_directories(self, tmp_path, valid_skill_yaml):
+        """Test metadata.yaml under a dot-directory is not loaded"""
+        hidden_dir = tmp_path / ".hidden"
+        hidden_dir.mkdir()
+        (hidden_dir / "metadata.yaml").write_text(valid_skill_yaml)
+
+        skill_dir = tmp_path / "skills" / "x"
+        skill_dir.mkdir(parents=True)
+        (skill_dir / "metadata.yaml").write_text(valid_skill_yaml)
+
+        capabilities = load_all_capabilities(tmp_path)
+
+        assert ".hidden" not in capabilities
+        assert list(capabilities) == ["skills/x"]
+
+    def test_full_composition_workflow(self, valid_skill_metadata, valid_workflow_metadata):
         """Test complete composition workflow"""
         # Setup: Create skills and workflows
         skill_meta = CapabilityMetadataParser._parse_metadata_dict(valid_skill_metadata)
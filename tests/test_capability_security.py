@@ -3,12 +3,8 @@ Tests for capability system security checks and error handling
 Targeting uncovered branches in copy_capability_templates
 """
 
-import sys
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+from unittest.mock import patch
 
 from proto_gear_pkg.proto_gear import copy_capability_templates
 
@@ -18,7 +14,8 @@ class TestCapabilitySecurityChecks:
 
     def test_source_directory_not_found(self, tmp_path):
         """Test error when source directory doesn't exist"""
-        with patch('pathlib.Path.exists', return_value=False):
+        # Relocate the module so its capabilities/ sibling is missing
+        with patch('proto_gear_pkg.proto_gear.__file__', str(tmp_path / 'proto_gear.py')):
             result = copy_capability_templates(
                 tmp_path,
                 project_name='test',
@@ -223,23 +220,22 @@ class TestCapabilityAdvancedSecurity:
         real_dir.mkdir()
         (real_dir / 'test.md').write_text('test')
 
-        # Create a symlink to it
-        link_dir = tmp_path / 'link_capabilities'
+        # Create a symlink to it where the module expects capabilities/
+        link_dir = tmp_path / 'capabilities'
         try:
             link_dir.symlink_to(real_dir, target_is_directory=True)
         except (OSError, NotImplementedError):
             pytest.skip("Symlinks not supported on this platform")
 
-        with patch('pathlib.Path.exists', return_value=True):
-            with patch('pathlib.Path.is_symlink', return_value=True):
-                result = copy_capability_templates(
-                    tmp_path,
-                    project_name='test',
-                    dry_run=True
-                )
-
-                assert result['status'] == 'error'
-                assert any('symlink' in err.lower() for err in result['errors'])
+        with patch('proto_gear_pkg.proto_gear.__file__', str(tmp_path / 'proto_gear.py')):
+            result = copy_capability_templates(
+                tmp_path,
+                project_name='test',
+                dry_run=True
+            )
+
+            assert result['status'] == 'error'
+            assert any('symlink' in err.lower() for err in result['errors'])
 
     def test_individual_file_symlink_skipped(self, tmp_path):
         """Test skipping of individual symlink files (lines 611-612)"""
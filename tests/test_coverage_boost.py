@@ -3,12 +3,8 @@ High-value tests to boost coverage from 39% to 81%+
 Focuses on uncovered branches and edge cases
 """
 
-import sys
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+from unittest.mock import Mock, patch
 
 from proto_gear_pkg.proto_gear import (
     detect_git_config,
@@ -5,7 +5,6 @@ Focused, high-value tests to achieve 81%+ coverage efficiently
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
 import sys
 
 from proto_gear_pkg.proto_gear import (
@@ -3,13 +3,8 @@ Tests for project detection and framework identification
 Targeting coverage of detect_project_structure edge cases
 """
 
-import sys
 import json
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, mock_open
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
 
 from proto_gear_pkg.proto_gear import detect_project_structure
 
@@ -3,19 +3,16 @@ Essential tests for proto_gear.py - unique functionality only
 (Duplicates removed - covered by test_essential_integration.py)
 """
 
-import sys
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+from unittest.mock import patch
 
 from proto_gear_pkg.proto_gear import (
     safe_input,
     generate_branching_doc,
     show_splash_screen,
     print_farewell,
-    show_help
+    show_help,
+    _build_parser
 )
 from proto_gear_pkg.ui_helper import Colors
 
@@ -120,5 +117,33 @@ class TestUIFunctions:
             assert 'pg' in captured.out or 'proto' in captured.out.lower()
 
 
+class TestArgumentParsing:
+    """Test command-line parsing without running main()"""
+
+    def test_init_defaults(self):
+        """Test init with no flags"""
+        args = _build_parser().parse_args(['init'])
+        assert args.command == 'init'
+        assert args.dry_run is False
+        assert args.with_branching is False
+        assert args.ticket_prefix is None
+
+    def test_init_flags(self):
+        """Test init flags reach the namespace"""
+        args = _build_parser().parse_args(
+            ['init', '--dry-run', '--with-branching', '--ticket-prefix', 'MYAPP']
+        )
+        assert args.dry_run is True
+        assert args.with_branching is True
+        assert args.ticket_prefix == 'MYAPP'
+
+    def test_update_templates(self):
+        """Test update collects template names"""
+        args = _build_parser().parse_args(['update', 'AGENTS.md', '--diff-only'])
+        assert args.command == 'update'
+        assert args.templates == ['AGENTS.md']
+        assert args.diff_only is True
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -3,14 +3,11 @@ High-value tests for proto_gear.py core functions
 Targeting 81%+ coverage by testing critical paths
 """
 
-import sys
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock, mock_open
+from unittest.mock import patch
 from datetime import datetime
 
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
-
 from proto_gear_pkg.proto_gear import (
     discover_available_templates,
     generate_project_template,
@@ -3,12 +3,8 @@ Tests for setup_agent_framework_only() function
 Targeting uncovered branches to increase coverage from 56% to 60%+
 """
 
-import sys
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+from unittest.mock import patch
 
 from proto_gear_pkg.proto_gear import setup_agent_framework_only
 
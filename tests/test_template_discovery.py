@@ -5,7 +5,7 @@ Critical feature that enables zero-code template addition
 
 import pytest
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch
 from proto_gear_pkg.proto_gear import discover_available_templates
 
 
@@ -7,12 +7,8 @@ template updates.
 
 import pytest
 import yaml
-from pathlib import Path
 from textwrap import dedent
 
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
-
 from proto_gear_pkg.template_updater import (
     UserDataExtractor,
     TemplateMerger,
@@ -2,13 +2,8 @@
 Tests for ui_helper.py UI utility functions
 """
 
-import sys
 import pytest
-from pathlib import Path
-from unittest.mock import Mock, patch, call
-
-# Add core to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
+from unittest.mock import patch
 
 from proto_gear_pkg.ui_helper import UIHelper, Colors
 
@@ -5,11 +5,7 @@ End-to-end tests for the full update workflow including CLI integration.
 """
 
 import pytest
-from pathlib import Path
 from textwrap import dedent
-import sys
-
-sys.path.insert(0, str(Path(__file__).parent.parent / 'core'))
 
 from proto_gear_pkg.template_updater import TemplateUpdater, TemplateUpdateError
 
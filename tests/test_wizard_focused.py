@@ -5,7 +5,6 @@ Targets interactive_wizard.py which is currently at 17%
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
 
 from proto_gear_pkg.interactive_wizard import (
     RichWizard,